@@ -8,7 +8,10 @@ from pathlib import Path
 import aiohttp
 
 import pudl_archiver.orchestrator  # noqa: F401
-from pudl_archiver.archivers.classes import AbstractDatasetArchiver
+from pudl_archiver.archivers.classes import (
+    DEFAULT_CONCURRENCY_LIMIT,
+    AbstractDatasetArchiver,
+)
 from pudl_archiver.archivers.validate import RunSummary
 from pudl_archiver.orchestrator import orchestrate_run
 from pudl_archiver.utils import RunSettings
@@ -66,7 +69,15 @@ async def archive_datasets(
     trace_config.on_response_chunk_received.append(on_response_chunk_received)
     trace_config.on_request_end.append(on_request_end)
 
-    connector = aiohttp.TCPConnector(limit_per_host=20, force_close=True)
+    # EIA starts throttling above ~20 parallel connections to the same host, so
+    # keep every archiver's bursts of requests safely below that. Connections are
+    # kept alive and reused so repeated requests to a host skip the TLS handshake.
+    connector = aiohttp.TCPConnector(
+        limit=DEFAULT_CONCURRENCY_LIMIT,
+        limit_per_host=15,
+        ttl_dns_cache=300,
+        force_close=False,
+    )
     async with aiohttp.ClientSession(
         trace_configs=[trace_config],
         connector=connector,
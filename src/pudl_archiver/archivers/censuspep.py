@@ -21,10 +21,8 @@ class CensusPepArchiver(AbstractDatasetArchiver):
         """Download Census PEP FIPS Codes resources."""
         # the BASE_URL page has a bunch of links with YEAR/ at the end
         link_pattern = re.compile(r"(\d{4})/$")
-        for link in await self.get_hyperlinks(BASE_URL, link_pattern):
-            matches = link_pattern.search(link)
-            if not matches:
-                continue
+        year_links = await self.get_hyperlink_matches(BASE_URL, link_pattern)
+        for matches in year_links.values():
             year = int(matches.group(1))
             if self.valid_year(year):
                 yield self.get_year_resource(year)
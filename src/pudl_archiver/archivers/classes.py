@@ -5,22 +5,27 @@ import io
 import json
 import logging
 import math
+import shutil
 import tempfile
 import typing
 import zipfile
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from contextlib import nullcontext
-from html.parser import HTMLParser
 from pathlib import Path
 
 import aiohttp
+import lxml.html
 import pandas as pd
 
 from pudl_archiver.archivers import validate
 from pudl_archiver.frictionless import DataPackage, ResourceInfo
 from pudl_archiver.utils import (
-    add_to_archive_stable_hash,
+    backoff_delay_s,
+    get_bytes,
+    get_text,
     retry_async,
+    zipinfo_stable_hash,
 )
 
 logger = logging.getLogger(f"catalystcoop.{__name__}")
@@ -31,6 +36,14 @@ MEDIA_TYPES: dict[str, str] = {
     "csv": "text/csv",
 }
 VALID_PARTITION_RANGES: dict[str, str] = {"year_quarter": "QS", "year_month": "MS"}
+DOWNLOAD_CHUNK_SIZE: int = 64 * 1024
+"""Number of bytes to read from a response body before writing them out."""
+DEFAULT_CONCURRENCY_LIMIT: int = 100
+"""Number of resources to download at once if an archiver sets no concurrency_limit.
+
+Also used as the total connection limit of the shared session's connector, so
+every default download can hold a connection at the same time.
+"""
 
 ArchiveAwaitable = typing.AsyncGenerator[
     typing.Awaitable[ResourceInfo | list[ResourceInfo]], None
@@ -44,20 +57,17 @@ pertaining to the resource.
 """
 
 
-class _HyperlinkExtractor(HTMLParser):
-    """Minimal HTML parser to extract hyperlinks from a webpage."""
+# get_text has already decoded the page, so re-encoded pages are always UTF-8
+_HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8")
 
-    def __init__(self):
-        """Construct parser."""
-        self.hyperlinks = set()
-        super().__init__()
 
-    def handle_starttag(self, tag, attrs):
-        """Filter hyperlink tags and return href attribute."""
-        if tag == "a":
-            for attr, val in attrs:
-                if attr == "href":
-                    self.hyperlinks.add(val)
+def _parse_hyperlinks(text: str) -> set[str]:
+    """Return the href of every hyperlink on a web page."""
+    # lxml refuses to parse an empty document
+    if not text.strip():
+        return set()
+    page = lxml.html.fromstring(text.encode("utf-8"), parser=_HTML_PARSER)
+    return set(page.xpath("//a/@href"))
 
 
 async def _download_file(
@@ -65,7 +75,40 @@ async def _download_file(
 ):
     async with session.get(url, **kwargs) as response:
         with file.open("wb") if isinstance(file, Path) else nullcontext(file) as f:
-            async for chunk in response.content.iter_chunked(1024):
+            async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+
+
+async def _download_and_zip_file(
+    session: aiohttp.ClientSession,
+    url: str,
+    filename: str,
+    zip_path: Path | io.BytesIO,
+    **kwargs,
+):
+    # ZipFile(file, "w") writes from the file's current position, so clear out
+    # anything a failed try left behind in an in-memory archive
+    if isinstance(zip_path, io.BytesIO):
+        zip_path.seek(0)
+        zip_path.truncate()
+
+    # Write chunks straight into the archive rather than holding the whole
+    # response in memory.
+    async with session.get(url, **kwargs) as response:
+        info = zipinfo_stable_hash(filename)
+        # An entry of unknown size may only grow past 2 GiB if it's written as
+        # ZIP64. Content-Length is only the file size if the body isn't encoded.
+        size_known = (
+            response.content_length is not None
+            and "Content-Encoding" not in response.headers
+        )
+        if size_known:
+            info.file_size = response.content_length
+        with (
+            zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as archive,
+            archive.open(info, "w", force_zip64=not size_known) as f,
+        ):
+            async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
                 f.write(chunk)
 
 
@@ -103,12 +146,20 @@ class AbstractDatasetArchiver(ABC):
         # Create a temporary directory for downloading data
         self.download_directory_manager = tempfile.TemporaryDirectory()
         self.download_directory = Path(self.download_directory_manager.name)
+        # Directories created by directory_per_resource_chunk, oldest first
+        self._chunk_directory_managers: list[tempfile.TemporaryDirectory] = []
 
         if only_years is None:
             only_years = []
         self.only_years = only_years
         self.file_validations: list[validate.FileUniversalValidation] = []
 
+        # Hyperlinks found on each web page, so pages are only fetched once per run
+        self._hyperlink_cache: dict[tuple[str, bool], set[str]] = {}
+        self._hyperlink_locks: defaultdict[tuple[str, bool], asyncio.Lock] = (
+            defaultdict(asyncio.Lock)
+        )
+
         # Create logger
         self.logger = logging.getLogger(f"catalystcoop.{__name__}")
         self.logger.info(f"Archiving {self.name}")
@@ -138,22 +189,38 @@ class AbstractDatasetArchiver(ABC):
         ...
 
     async def download_zipfile(
-        self, url: str, zip_path: Path | io.BytesIO, retries: int = 5, **kwargs
+        self,
+        url: str,
+        zip_path: Path | io.BytesIO,
+        retries: int = 5,
+        retry_base_s: float = 1.0,
+        **kwargs,
     ):
         """Attempt to download a zipfile and retry if zipfile is invalid.
 
+        Waits with jittered exponential backoff (capped at 30 seconds) between
+        attempts, so a rate limited server isn't hit again right away.
+
         Args:
             url: URL of zipfile.
             zip_path: Local path to write file to disk or bytes object to save file in memory.
             retries: Number of times to attempt to download a zipfile.
+            retry_base_s: How many seconds to wait after the first invalid zipfile.
             kwargs: Key word args to pass to request.
         """
-        for _ in range(0, retries):
+        for try_count in range(1, retries + 1):
             await self.download_file(url, zip_path, **kwargs)
 
             if zipfile.is_zipfile(zip_path):
                 return
 
+            if try_count < retries:
+                retry_delay_s = backoff_delay_s(try_count, retry_base_s, max_s=30)
+                self.logger.info(
+                    f"Invalid zipfile downloaded from {url} (try #{try_count}, retry in {retry_delay_s:.1f}s)"
+                )
+                await asyncio.sleep(retry_delay_s)
+
         # If it makes it here that means it couldn't download a valid zipfile
         raise RuntimeError(f"Failed to download valid zipfile from {url}")
 
@@ -168,62 +235,87 @@ class AbstractDatasetArchiver(ABC):
         await retry_async(_download_file, [self.session, url, file_path], kwargs)
 
     async def download_and_zip_file(
-        self, url: str, filename: str, zip_path: Path, **kwargs
+        self, url: str, filename: str, zip_path: Path | io.BytesIO, **kwargs
     ):
         """Download and zip a file using async session manager.
 
+        The response is streamed straight into the archive, so the file never
+        has to fit in memory or be written to disk uncompressed first.
+
         Args:
             url: URL to file to download.
             filename: name of file to be zipped
-            zip_path: Local path to write file to disk.
+            zip_path: Local path to write file to disk or bytes object to save file in memory.
             kwargs: Key word args to pass to retry_async.
         """
-        response = await retry_async(self.session.get, args=[url], kwargs=kwargs)
-        response_bytes = await retry_async(response.read)
-
-        # Write to zipfile
-        with zipfile.ZipFile(
-            zip_path,
-            "w",
-            compression=zipfile.ZIP_DEFLATED,
-        ) as archive:
-            add_to_archive_stable_hash(
-                archive=archive, filename=filename, data=response_bytes
-            )
+        await retry_async(
+            _download_and_zip_file, [self.session, url, filename, zip_path], kwargs
+        )
+
+    def add_to_archive(
+        self, archive: zipfile.ZipFile, filename: str, blob: typing.BinaryIO
+    ):
+        """Add a file to an open ZIP archive.
+
+        Open the archive once and add all of its files to the same handle.
+        Re-opening an archive in append mode for every file means re-reading and
+        re-writing its central directory each time.
 
-    def add_to_archive(self, zip_path: Path, filename: str, blob: typing.BinaryIO):
-        """Add a file to a ZIP archive.
+        The blob is copied into the archive in chunks, so the whole file never
+        has to fit in memory.
 
         Args:
-            zip_path: path to target archive.
+            archive: target archive, opened for writing.
             filename: name of the file *within* the archive.
             blob: the content you'd like to write to the archive.
         """
-        with zipfile.ZipFile(
-            zip_path,
-            "a",
-            compression=zipfile.ZIP_DEFLATED,
-        ) as archive:
-            add_to_archive_stable_hash(
-                archive=archive, filename=filename, data=blob.read()
-            )
+        info = zipinfo_stable_hash(filename)
+        # Same size ZipFile.writestr would record, so the archive's hash and
+        # whether the entry needs ZIP64 don't change
+        start = blob.tell()
+        info.file_size = blob.seek(0, io.SEEK_END) - start
+        blob.seek(start)
+        with archive.open(info, "w") as f:
+            shutil.copyfileobj(blob, f, DOWNLOAD_CHUNK_SIZE)
 
     async def get_json(self, url: str, **kwargs) -> dict[str, str]:
         """Get a JSON and return it as a dictionary."""
-        response = await retry_async(self.session.get, args=[url], kwargs=kwargs)
-        response_bytes = await retry_async(response.read)
+        response_bytes = await retry_async(get_bytes, [self.session, url], kwargs)
         try:
             json_obj = json.loads(response_bytes.decode("utf-8"))
         except json.JSONDecodeError:
             raise AssertionError(f"Invalid JSON string: {response_bytes}")
         return json_obj
 
+    async def _get_page_hyperlinks(self, url: str, verify: bool) -> set[str]:
+        """Return all hyperlinks on a web page, fetching it only on the first call."""
+        page_key = (url, verify)
+        # Concurrent calls on the same page wait for the first one to fetch it
+        async with self._hyperlink_locks[page_key]:
+            if page_key not in self._hyperlink_cache:
+                text = await retry_async(
+                    get_text, [self.session, url], kwargs={"ssl": verify}
+                )
+
+                # Parse web page to get all hyperlinks
+                self._hyperlink_cache[page_key] = _parse_hyperlinks(text)
+        return set(self._hyperlink_cache[page_key])
+
+    def _warn_if_no_hyperlinks(
+        self, hyperlinks: typing.Collection[str], url: str, filter_pattern
+    ):
+        if not hyperlinks:
+            self.logger.warning(
+                f"The archiver couldn't find any hyperlinks that match {filter_pattern}."
+                f"Make sure your filter_pattern is correct or if the structure of the {url} page changed."
+            )
+
     async def get_hyperlinks(
         self,
         url: str,
         filter_pattern: typing.Pattern | None = None,
         verify: bool = True,
-    ) -> list[str]:
+    ) -> set[str]:
         """Return all hyperlinks from a specific web page.
 
         This is a helper function to perform very basic web-scraping functionality.
@@ -231,50 +323,66 @@ class AbstractDatasetArchiver(ABC):
         a specified pattern. This means it can find all hyperlinks that look like
         a download link to a single data resource.
 
+        Each web page is only fetched once per archiver, no matter how many times
+        this is called on it.
+
         Args:
             url: URL of web page.
             filter_pattern: If present, only return links that contain pattern.
             verify: Verify ssl certificate (EPACEMS https source has bad certificate).
         """
-        # Parse web page to get all hyperlinks
-        parser = _HyperlinkExtractor()
+        if filter_pattern:
+            return set(await self.get_hyperlink_matches(url, filter_pattern, verify))
 
-        response = await retry_async(
-            self.session.get, args=[url], kwargs={"ssl": verify}
-        )
-        text = await retry_async(response.text)
-        parser.feed(text)
+        hyperlinks = await self._get_page_hyperlinks(url, verify)
+        self._warn_if_no_hyperlinks(hyperlinks, url, filter_pattern)
+        return hyperlinks
 
-        # Filter to those that match filter_pattern
-        hyperlinks = parser.hyperlinks
-        if filter_pattern:
-            hyperlinks = {link for link in hyperlinks if filter_pattern.search(link)}
+    async def get_hyperlink_matches(
+        self,
+        url: str,
+        filter_pattern: typing.Pattern,
+        verify: bool = True,
+    ) -> dict[str, typing.Match]:
+        """Return hyperlinks from a web page that match a pattern, with their matches.
 
-        # Warn if no links are found
-        if not hyperlinks:
-            self.logger.warning(
-                f"The archiver couldn't find any hyperlinks that match {filter_pattern}."
-                f"Make sure your filter_pattern is correct or if the structure of the {url} page changed."
-            )
+        Like :meth:`get_hyperlinks`, but hands back the match for each link so
+        callers that need to pull groups out of it don't have to search it again.
 
-        return hyperlinks
+        Args:
+            url: URL of web page.
+            filter_pattern: Only return links that contain pattern.
+            verify: Verify ssl certificate (EPACEMS https source has bad certificate).
+        """
+        matches = {
+            link: match
+            for link in await self._get_page_hyperlinks(url, verify)
+            if (match := filter_pattern.search(link))
+        }
+        self._warn_if_no_hyperlinks(matches, url, filter_pattern)
+        return matches
+
+    @staticmethod
+    def _summarize(datapackage: DataPackage | None) -> dict[str, int] | None:
+        """Map each resource name in a datapackage to its size in bytes.
+
+        Computed once per datapackage in :meth:`validate_dataset` and shared by all
+        of the checks that only need resource names and sizes.
+        """
+        if datapackage is None:
+            return None
+        return {resource.name: resource.bytes_ for resource in datapackage.resources}
 
     def _check_missing_files(
         self,
-        baseline_datapackage: DataPackage | None,
-        new_datapackage: DataPackage,
+        baseline_sizes: dict[str, int] | None,
+        new_sizes: dict[str, int],
     ) -> validate.DatasetUniversalValidation:
         """Check for any files from previous archive version missing in new version."""
-        baseline_resources = set()
-        if baseline_datapackage is not None:
-            baseline_resources = {
-                resource.name for resource in baseline_datapackage.resources
-            }
-
-        new_resources = {resource.name for resource in new_datapackage.resources}
+        baseline_resources = set() if baseline_sizes is None else baseline_sizes.keys()
 
         # Check for any files only in baseline_datapackage
-        missing_files = baseline_resources - new_resources
+        missing_files = set(baseline_resources - new_sizes.keys())
 
         notes = None
         if len(missing_files) > 0:
@@ -292,42 +400,31 @@ class AbstractDatasetArchiver(ABC):
 
     def _check_file_size(
         self,
-        baseline_datapackage: DataPackage | None,
-        new_datapackage: DataPackage,
+        baseline_sizes: dict[str, int] | None,
+        new_sizes: dict[str, int],
     ) -> validate.DatasetUniversalValidation:
         """Check if any one file's size has changed by |>allowed_file_rel_diff|."""
         notes = None
-        if baseline_datapackage is None:
+        if baseline_sizes is None:
             too_changed_files = False  # No files to compare to
         else:
-            baseline_resources = {
-                resource.name: resource.bytes_
-                for resource in baseline_datapackage.resources
-            }
-            too_changed_files = {}
+            baseline = pd.Series(baseline_sizes, dtype=float)
+            new = pd.Series(new_sizes, dtype=float)
 
-            new_resources = {
-                resource.name: resource.bytes_ for resource in new_datapackage.resources
-            }
+            for resource_name in baseline.index[baseline == 0].intersection(new.index):
+                logger.warning(
+                    f"Original file size was zero for {resource_name}. Ignoring file size check."
+                )
 
             # Check to see that file size hasn't changed by more than |>allowed_file_rel_diff|
-            # for each dataset in the baseline datapackage
-            for resource_name in baseline_resources:
-                if resource_name in new_resources:
-                    try:
-                        file_size_change = abs(
-                            (
-                                new_resources[resource_name]
-                                - baseline_resources[resource_name]
-                            )
-                            / baseline_resources[resource_name]
-                        )
-                        if file_size_change > self.allowed_file_rel_diff:
-                            too_changed_files.update({resource_name: file_size_change})
-                    except ZeroDivisionError:
-                        logger.warning(
-                            f"Original file size was zero for {resource_name}. Ignoring file size check."
-                        )
+            # for each dataset in the baseline datapackage. Files missing from
+            # either datapackage or with an original size of zero come out as NaN.
+            file_size_change = (
+                (new - baseline).abs() / baseline.where(baseline != 0)
+            ).dropna()
+            too_changed_files = file_size_change[
+                file_size_change > self.allowed_file_rel_diff
+            ].to_dict()
 
             if too_changed_files:  # If files are "too changed"
                 notes = [
@@ -344,20 +441,17 @@ class AbstractDatasetArchiver(ABC):
 
     def _check_dataset_size(
         self,
-        baseline_datapackage: DataPackage | None,
-        new_datapackage: DataPackage,
+        baseline_sizes: dict[str, int] | None,
+        new_sizes: dict[str, int],
     ) -> validate.DatasetUniversalValidation:
         """Check if a dataset's overall size has changed by more than |>allowed_dataset_rel_diff|."""
         notes = None
 
-        if baseline_datapackage is None:
+        if baseline_sizes is None:
             dataset_size_change = 0.0  # No change in size if no baseline
         else:
-            baseline_size = sum(
-                [resource.bytes_ for resource in baseline_datapackage.resources]
-            )
-
-            new_size = sum([resource.bytes_ for resource in new_datapackage.resources])
+            baseline_size = sum(baseline_sizes.values())
+            new_size = sum(new_sizes.values())
 
             # Check to see that overall dataset size hasn't changed by more than
             # |>allowed_dataset_rel_diff|
@@ -381,27 +475,22 @@ class AbstractDatasetArchiver(ABC):
         """Check that the archived data partitions are continuous and unique."""
         success = True
         note = None
-        partition_to_test = []
+        # Tested partition keys, in the order they're found. Keys of a dict rather
+        # than a list so collecting them doesn't rescan the ones already seen.
+        partitions_to_test: dict[str, None] = {}
         dataset_partitions = []
 
-        # Unpack partitions of a dataset.
+        # Unpack partitions of a dataset in a single pass.
         for resource in new_datapackage.resources:
-            if not resource.parts:  # Skip resources without partitions
-                continue
-            for partition_name, partition_values in resource.parts.items():
-                if (
-                    partition_name in VALID_PARTITION_RANGES
-                ):  # If partition to be tested
-                    partition_to_test += (
-                        [partition_name]
-                        if partition_name not in partition_to_test
-                        else []
-                    )  # Compile unique partition keys
-                    dataset_partitions += (
-                        partition_values
-                        if isinstance(partition_values, list)
-                        else [partition_values]
-                    )  # Unpack lists where needed
+            for partition_name, partition_values in (resource.parts or {}).items():
+                if partition_name not in VALID_PARTITION_RANGES:
+                    continue
+                partitions_to_test[partition_name] = None
+                if isinstance(partition_values, list):  # Unpack lists where needed
+                    dataset_partitions.extend(partition_values)
+                else:
+                    dataset_partitions.append(partition_values)
+        partition_to_test = list(partitions_to_test)
 
         # Only perform this test if the part label is year quarter or year month
         # Note that this currently only works if there is one set of partitions,
@@ -409,10 +498,11 @@ class AbstractDatasetArchiver(ABC):
         if partition_to_test:
             if len(partition_to_test) == 1:
                 interval = VALID_PARTITION_RANGES[partition_to_test[0]]
+                # Parse partitions once and reuse the parsed dates for the bounds
+                observed_date_range = pd.to_datetime(dataset_partitions)
                 expected_date_range = pd.date_range(
-                    min(dataset_partitions), max(dataset_partitions), freq=interval
+                    observed_date_range.min(), observed_date_range.max(), freq=interval
                 )
-                observed_date_range = pd.to_datetime(dataset_partitions)
                 diff = expected_date_range.difference(observed_date_range)
 
                 if observed_date_range.has_duplicates:
@@ -466,13 +556,11 @@ class AbstractDatasetArchiver(ABC):
         validations: list[validate.ValidationTestResult] = []
 
         # Run baseline set of validations for dataset using datapackage
-        validations.append(
-            self._check_missing_files(baseline_datapackage, new_datapackage)
-        )
-        validations.append(self._check_file_size(baseline_datapackage, new_datapackage))
-        validations.append(
-            self._check_dataset_size(baseline_datapackage, new_datapackage)
-        )
+        baseline_sizes = self._summarize(baseline_datapackage)
+        new_sizes = self._summarize(new_datapackage)
+        validations.append(self._check_missing_files(baseline_sizes, new_sizes))
+        validations.append(self._check_file_size(baseline_sizes, new_sizes))
+        validations.append(self._check_dataset_size(baseline_sizes, new_sizes))
         validations.append(self._check_data_continuity(new_datapackage))
 
         # Add per-file validations
@@ -502,64 +590,150 @@ class AbstractDatasetArchiver(ABC):
         """
         return (not self.only_years) or int(year) in self.only_years
 
+    def _validate_downloaded(
+        self, resources: ResourceInfo | list[ResourceInfo]
+    ) -> typing.Generator[tuple[str, ResourceInfo], None, None]:
+        """Run file validations on downloaded resources and yield them by name."""
+        # A resource awaitable can return a list or an individual resource
+        # If individual resource, create list of 1 to make iterable
+        if not isinstance(resources, list):
+            resources = [resources]
+
+        for resource_info in resources:
+            self.logger.info(f"Downloaded {resource_info.local_path}.")
+
+            # Perform various file validations
+            self.file_validations.extend(
+                [
+                    validate.validate_filetype(
+                        resource_info.local_path,
+                        self.fail_on_empty_invalid_files,
+                    ),
+                    validate.validate_file_not_empty(
+                        resource_info.local_path,
+                        self.fail_on_empty_invalid_files,
+                    ),
+                    validate.validate_zip_layout(
+                        resource_info.local_path,
+                        resource_info.layout,
+                        self.fail_on_empty_invalid_files,
+                    ),
+                ]
+            )
+
+            yield str(resource_info.local_path.name), resource_info
+
+    async def _produce_resources(
+        self, resource_queue: asyncio.Queue, result_queue: asyncio.Queue, workers: int
+    ):
+        """Queue up awaitables from get_resources, then tell each worker to stop."""
+        try:
+            async for resource in self.get_resources():
+                await resource_queue.put(resource)
+        except Exception as e:
+            await result_queue.put(e)
+        for _ in range(workers):
+            await resource_queue.put(None)
+
+    @staticmethod
+    async def _download_resources(
+        resource_queue: asyncio.Queue, result_queue: asyncio.Queue
+    ):
+        """Await queued resources one at a time until told to stop."""
+        while (resource := await resource_queue.get()) is not None:
+            try:
+                await result_queue.put(await resource)
+            except Exception as e:
+                await result_queue.put(e)
+        await result_queue.put(None)
+
     async def download_all_resources(
         self,
     ) -> typing.Generator[tuple[str, ResourceInfo], None, None]:
         """Download all resources.
 
         This method uses the awaitables returned by `get_resources`. It
-        coordinates downloading all resources concurrently.
+        coordinates downloading all resources concurrently, with at most
+        ``concurrency_limit`` downloads running at any one time. Downloads
+        start as soon as `get_resources` yields them.
         """
+        if self.directory_per_resource_chunk:
+            async for downloaded in self._download_resource_chunks():
+                yield downloaded
+            return
+
+        workers = self.concurrency_limit or DEFAULT_CONCURRENCY_LIMIT
+        self.logger.info(f"Downloading at most {workers} resources at a time")
+
+        # Bound the queue so get_resources doesn't run too far ahead of downloads
+        resource_queue = asyncio.Queue(maxsize=2 * workers)
+        result_queue = asyncio.Queue()
+        tasks = [
+            asyncio.create_task(
+                self._produce_resources(resource_queue, result_queue, workers)
+            )
+        ] + [
+            asyncio.create_task(self._download_resources(resource_queue, result_queue))
+            for _ in range(workers)
+        ]
+
+        try:
+            # Each worker puts None on the result queue once it's done
+            finished_workers = 0
+            while finished_workers < workers:
+                result = await result_queue.get()
+                if result is None:
+                    finished_workers += 1
+                    continue
+                if isinstance(result, Exception):
+                    raise result
+                for downloaded in self._validate_downloaded(result):
+                    yield downloaded
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            # Close any resources that were queued but never started
+            while not resource_queue.empty():
+                if asyncio.iscoroutine(resource := resource_queue.get_nowait()):
+                    resource.close()
+
+    async def _download_resource_chunks(
+        self,
+    ) -> typing.Generator[tuple[str, ResourceInfo], None, None]:
+        """Download resources in chunks, each with its own download directory."""
         # Get all awaitables from get_resources
         resources = [resource async for resource in self.get_resources()]
 
-        # Split resources into chunks to limit concurrency
+        # Wait for a whole chunk to finish before starting the next one
         chunksize = self.concurrency_limit if self.concurrency_limit else len(resources)
         resource_chunks = [
             resources[i * chunksize : (i + 1) * chunksize]
             for i in range(math.ceil(len(resources) / chunksize))
         ]
-
-        if self.concurrency_limit:
-            self.logger.info("Downloading resources in chunks to limit concurrency")
-            self.logger.info(f"Resource chunks: {len(resource_chunks)}")
-            self.logger.info(f"Resources per chunk: {chunksize}")
+        self.logger.info("Downloading resources in chunks")
+        self.logger.info(f"Resource chunks: {len(resource_chunks)}")
+        self.logger.info(f"Resources per chunk: {chunksize}")
 
         # Download resources concurrently and prepare metadata
         for resource_chunk in resource_chunks:
             for resource_coroutine in asyncio.as_completed(resource_chunk):
-                # resource_coroutine can return list or individual resource
-                # If individual resource, create list of 1 to make iterable
-                if not isinstance(resources := await resource_coroutine, list):
-                    resources = [resources]
-
-                for resource_info in resources:
-                    self.logger.info(f"Downloaded {resource_info.local_path}.")
-
-                    # Perform various file validations
-                    self.file_validations.extend(
-                        [
-                            validate.validate_filetype(
-                                resource_info.local_path,
-                                self.fail_on_empty_invalid_files,
-                            ),
-                            validate.validate_file_not_empty(
-                                resource_info.local_path,
-                                self.fail_on_empty_invalid_files,
-                            ),
-                            validate.validate_zip_layout(
-                                resource_info.local_path,
-                                resource_info.layout,
-                                self.fail_on_empty_invalid_files,
-                            ),
-                        ]
-                    )
-
-                    # Return downloaded
-                    yield str(resource_info.local_path.name), resource_info
-
-            # If requested, create a new temporary directory per resource chunk
-            if self.directory_per_resource_chunk:
-                tmp_dir = tempfile.TemporaryDirectory()
-                self.download_directory = Path(tmp_dir.name)
-                self.logger.info(f"New download directory {self.download_directory}")
+                for downloaded in self._validate_downloaded(await resource_coroutine):
+                    yield downloaded
+
+            # Create a new temporary directory per resource chunk
+            self._rotate_chunk_directory()
+
+    def _rotate_chunk_directory(self):
+        """Point download_directory at a fresh temporary directory.
+
+        Keep the directory of the chunk that just finished around, but clean up
+        the one before it. Its files were handed off a whole chunk ago, and
+        cleaning it up here, rather than whenever it's garbage collected, keeps
+        disk usage bounded and predictable.
+        """
+        if len(self._chunk_directory_managers) > 1:
+            self._chunk_directory_managers.pop(0).cleanup()
+        self._chunk_directory_managers.append(tempfile.TemporaryDirectory())
+        self.download_directory = Path(self._chunk_directory_managers[-1].name)
+        self.logger.info(f"New download directory {self.download_directory}")
@@ -19,10 +19,8 @@ class Eia860Archiver(AbstractDatasetArchiver):
     async def get_resources(self) -> ArchiveAwaitable:
         """Download EIA-860 resources."""
         link_pattern = re.compile(r"eia860(\d{4})(ER)*.zip")
-        for link in await self.get_hyperlinks(BASE_URL, link_pattern):
-            matches = link_pattern.search(link)
-            if not matches:
-                continue
+        year_links = await self.get_hyperlink_matches(BASE_URL, link_pattern)
+        for link, matches in year_links.items():
             year = int(matches.group(1))
             if self.valid_year(year):
                 yield self.get_year_resource(link, year)
@@ -2,6 +2,7 @@
 
 import calendar
 import re
+import zipfile
 from collections import defaultdict
 
 from pudl_archiver.archivers.classes import (
@@ -27,10 +28,8 @@ class Eia860MArchiver(AbstractDatasetArchiver):
         link_pattern = re.compile(r"([a-z]+)_generator(\d{4}).xlsx")
 
         year_links: dict[int, dict[int, str]] = defaultdict(dict)
-        for link in await self.get_hyperlinks(BASE_URL, link_pattern):
-            match = link_pattern.search(link)
-            if not match:
-                continue
+        month_links = await self.get_hyperlink_matches(BASE_URL, link_pattern)
+        for link, match in month_links.items():
             year = int(match.group(2))
             month = self.month_map[match.group(1)]
             if self.valid_year(year):
@@ -45,20 +44,20 @@ class Eia860MArchiver(AbstractDatasetArchiver):
         """Download xlsx file."""
         zip_path = self.download_directory / f"eia860m-{year}.zip"
         data_paths_in_archive = set()
-        for month, link in sorted(month_links.items()):
-            url = f"https://eia.gov/{link}"
-            filename = f"eia860m-{year}-{month:02}.xlsx"
-            download_path = self.download_directory / filename
-            await self.download_file(url, download_path)
-            self.add_to_archive(
-                zip_path=zip_path,
-                filename=filename,
-                blob=download_path.open("rb"),
-            )
-            data_paths_in_archive.add(filename)
-            # Don't want to leave multiple giant CSVs on disk, so delete
-            # immediately after they're safely stored in the ZIP
-            download_path.unlink()
+        with zipfile.ZipFile(
+            zip_path, "w", compression=zipfile.ZIP_DEFLATED
+        ) as archive:
+            for month, link in sorted(month_links.items()):
+                url = f"https://eia.gov/{link}"
+                filename = f"eia860m-{year}-{month:02}.xlsx"
+                download_path = self.download_directory / filename
+                await self.download_file(url, download_path)
+                with download_path.open("rb") as blob:
+                    self.add_to_archive(archive=archive, filename=filename, blob=blob)
+                data_paths_in_archive.add(filename)
+                # Don't want to leave multiple giant CSVs on disk, so delete
+                # immediately after they're safely stored in the ZIP
+                download_path.unlink()
 
         return ResourceInfo(
             local_path=zip_path,
@@ -21,8 +21,9 @@ class Eia861Archiver(AbstractDatasetArchiver):
         """Download EIA-861 resources."""
         link_pattern = re.compile(r"f861(\d{2,4})(er)*.zip")
 
-        for link in await self.get_hyperlinks(BASE_URL, link_pattern):
-            year = int(link_pattern.search(link).group(1))
+        year_links = await self.get_hyperlink_matches(BASE_URL, link_pattern)
+        for link, matches in year_links.items():
+            year = int(matches.group(1))
             # Older file names only have last two digits of year in name
             # Convert to 4-digit years
             if year < 100 and year >= 90:
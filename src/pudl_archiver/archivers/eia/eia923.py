@@ -21,8 +21,9 @@ class Eia923Archiver(AbstractDatasetArchiver):
         """Download EIA-923 resources."""
         link_pattern = re.compile(r"f((923)|(906920))_(\d{4})(er)*\.zip")
 
-        for link in await self.get_hyperlinks(BASE_URL, link_pattern):
-            year = int(link_pattern.search(link).group(4))
+        year_links = await self.get_hyperlink_matches(BASE_URL, link_pattern)
+        for link, matches in year_links.items():
+            year = int(matches.group(4))
             if self.valid_year(year):
                 yield self.get_year_resource(link, year)
 
@@ -1,6 +1,7 @@
 """Download EIA-930 data."""
 
 import logging
+import zipfile
 from pathlib import Path
 
 import pandas as pd
@@ -53,20 +54,22 @@ class Eia930Archiver(AbstractDatasetArchiver):
         period_files = file_list[
             (year == file_list.YEAR) & (half_year == file_list.PERIOD)
         ]
-        for index, file in period_files.iterrows():
-            url = BASE_URL + file.FILENAME
-            filename = f"eia930-{year}half{half_year}-{file.DESCRIPTION.lower()}.csv"
-            download_path = self.download_directory / filename
-            await self.download_file(url, download_path)
-            self.add_to_archive(
-                zip_path=zip_path,
-                filename=filename,
-                blob=download_path.open("rb"),
-            )
-            data_paths_in_archive.add(filename)
-            # Don't want to leave multiple giant CSVs on disk, so delete
-            # immediately after they're safely stored in the ZIP
-            download_path.unlink()
+        with zipfile.ZipFile(
+            zip_path, "w", compression=zipfile.ZIP_DEFLATED
+        ) as archive:
+            for index, file in period_files.iterrows():
+                url = BASE_URL + file.FILENAME
+                filename = (
+                    f"eia930-{year}half{half_year}-{file.DESCRIPTION.lower()}.csv"
+                )
+                download_path = self.download_directory / filename
+                await self.download_file(url, download_path)
+                with download_path.open("rb") as blob:
+                    self.add_to_archive(archive=archive, filename=filename, blob=blob)
+                data_paths_in_archive.add(filename)
+                # Don't want to leave multiple giant CSVs on disk, so delete
+                # immediately after they're safely stored in the ZIP
+                download_path.unlink()
 
         return ResourceInfo(
             local_path=zip_path,
@@ -1,5 +1,6 @@
 """Archive EIA Manufacturing Energy Consumption Survey (MECS)."""
 
+import asyncio
 import logging
 import re
 
@@ -27,27 +28,42 @@ class EiaMECSArchiver(AbstractDatasetArchiver):
         """Download all excel tables for a year."""
         table_link_pattern = re.compile(r"[Tt]able(\d{1,2})_(\d{1,2}).xlsx")
 
-        # Loop through all download links for tables
-        tables = []
+        # Download all tables for the year concurrently
         year_url = f"{BASE_URL}/{year}"
-        for table_link in await self.get_hyperlinks(year_url, table_link_pattern):
-            table_link = f"{year_url}/{table_link}"
-            logger.info(f"Fetching {table_link}")
-            # Get table major/minor number from links
-            match = table_link_pattern.search(table_link)
-            major_num, minor_num = match.group(1), match.group(2)
-
-            # Download file
-            download_path = (
-                self.download_directory
-                / f"eia-mecs-{year}-table-{major_num}-{minor_num}.xlsx"
-            )
-            await self.download_zipfile(table_link, download_path)
+        table_links = await self.get_hyperlink_matches(year_url, table_link_pattern)
+
+        # The same table can be linked more than once (e.g. with different
+        # capitalization), and every copy would race to the same download path.
+        # Links are sorted so the same copy is picked on every run.
+        tables: dict[tuple[str, str], tuple[str, re.Match]] = {}
+        for table_link, match in sorted(table_links.items()):
+            tables.setdefault(match.groups(), (table_link, match))
 
-            tables.append(
-                ResourceInfo(
-                    local_path=download_path,
-                    partitions={"year": year, "table": f"{major_num}_{minor_num}"},
-                )
+        return list(
+            await asyncio.gather(
+                *[
+                    self.get_table_resource(year, f"{year_url}/{table_link}", match)
+                    for table_link, match in tables.values()
+                ]
             )
-        return tables
+        )
+
+    async def get_table_resource(
+        self, year: int, table_link: str, match: re.Match
+    ) -> ResourceInfo:
+        """Download a single excel table."""
+        logger.info(f"Fetching {table_link}")
+        # Get table major/minor number from links
+        major_num, minor_num = match.group(1), match.group(2)
+
+        # Download file
+        download_path = (
+            self.download_directory
+            / f"eia-mecs-{year}-table-{major_num}-{minor_num}.xlsx"
+        )
+        await self.download_zipfile(table_link, download_path)
+
+        return ResourceInfo(
+            local_path=download_path,
+            partitions={"year": year, "table": f"{major_num}_{minor_num}"},
+        )
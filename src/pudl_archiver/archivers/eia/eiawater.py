@@ -23,8 +23,8 @@ class EiaWaterArchiver(AbstractDatasetArchiver):
         """Download EIA Thermal Cooling Water resources."""
         link_pattern = re.compile(r"[Cc]ooling\w+([Ss]ummary|[Dd]etail)_(\d{4})\.xlsx")
 
-        for link in await self.get_hyperlinks(BASE_URL, link_pattern):
-            match = link_pattern.search(link)
+        table_links = await self.get_hyperlink_matches(BASE_URL, link_pattern)
+        for link, match in table_links.items():
             table = match.group(1).lower()
             year = int(match.group(2))
             if self.valid_year(year):
@@ -4,6 +4,7 @@ import datetime
 import json
 import logging
 import os
+import zipfile
 from collections.abc import Iterable
 from itertools import groupby
 
@@ -115,25 +116,25 @@ class EpaCemsArchiver(AbstractDatasetArchiver):
         """
         zip_path = self.download_directory / f"epacems-{year}.zip"
         data_paths_in_archive = set()
-        for file in files:
-            url = self.base_url + file.s3_path
-            quarter = file.metadata.quarter
-
-            # Useful to debug at download time-outs.
-            logger.info(f"Downloading {year} Q{quarter} EPACEMS data from {url}.")
-
-            filename = f"epacems-{year}q{quarter}.csv"
-            file_path = self.download_directory / filename
-            await self.download_file(url=url, file_path=file_path)
-            self.add_to_archive(
-                zip_path=zip_path,
-                filename=filename,
-                blob=file_path.open("rb"),
-            )
-            data_paths_in_archive.add(filename)
-            # Don't want to leave multiple giant CSVs on disk, so delete
-            # immediately after they're safely stored in the ZIP
-            file_path.unlink()
+        with zipfile.ZipFile(
+            zip_path, "w", compression=zipfile.ZIP_DEFLATED
+        ) as archive:
+            for file in files:
+                url = self.base_url + file.s3_path
+                quarter = file.metadata.quarter
+
+                # Useful to debug at download time-outs.
+                logger.info(f"Downloading {year} Q{quarter} EPACEMS data from {url}.")
+
+                filename = f"epacems-{year}q{quarter}.csv"
+                file_path = self.download_directory / filename
+                await self.download_file(url=url, file_path=file_path)
+                with file_path.open("rb") as blob:
+                    self.add_to_archive(archive=archive, filename=filename, blob=blob)
+                data_paths_in_archive.add(filename)
+                # Don't want to leave multiple giant CSVs on disk, so delete
+                # immediately after they're safely stored in the ZIP
+                file_path.unlink()
 
         return ResourceInfo(
             local_path=zip_path,
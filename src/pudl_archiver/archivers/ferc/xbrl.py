@@ -25,7 +25,7 @@ from tqdm import tqdm
 
 from pudl_archiver.archivers.classes import ResourceInfo
 from pudl_archiver.frictionless import ZipLayout
-from pudl_archiver.utils import retry_async
+from pudl_archiver.utils import get_bytes, retry_async
 
 logger = logging.getLogger(f"catalystcoop.{__name__}")
 
@@ -276,8 +276,7 @@ async def archive_taxonomies(
                         continue
 
                     # Download file
-                    response = await retry_async(session.get, args=[url])
-                    response_bytes = await retry_async(response.content.read)
+                    response_bytes = await retry_async(get_bytes, args=[session, url])
                     path = Path(url_parsed.path).relative_to("/")
                     archive_files.add(path)
 
@@ -331,12 +330,11 @@ async def archive_year(
 
             # Download filing
             try:
-                response = await retry_async(
-                    session.get,
-                    args=[str(filing.download_url)],
+                response_bytes = await retry_async(
+                    get_bytes,
+                    args=[session, str(filing.download_url)],
                     kwargs={"raise_for_status": True},
                 )
-                response_bytes = await retry_async(response.content.read)
             except aiohttp.client_exceptions.ClientResponseError as e:
                 logger.warning(
                     f"Failed to download XBRL filing {filing.title} for form{form_number}-{year}: {e.message}"
@@ -23,10 +23,8 @@ class NrelAtbArchiver(AbstractDatasetArchiver):
     async def get_resources(self) -> ArchiveAwaitable:
         """Using years gleaned from LINK_URL, iterate and download all files."""
         link_pattern = re.compile(r"parquet%2F(\d{4})")
-        for link in await self.get_hyperlinks(LINK_URL, link_pattern):
-            matches = link_pattern.search(link)
-            if not matches:
-                continue
+        year_links = await self.get_hyperlink_matches(LINK_URL, link_pattern)
+        for matches in year_links.values():
             year = int(matches.group(1))
             if self.valid_year(year):
                 yield self.get_year_resource(year)
@@ -36,16 +36,10 @@ class PhmsaGasArchiver(AbstractDatasetArchiver):
         link_pattern = re.compile(r"annual[-|_](\S+).zip")
 
         # Get main table links.
-        links = await self.get_hyperlinks(BASE_URL, link_pattern)
+        links = await self.get_hyperlink_matches(BASE_URL, link_pattern)
         forms = [
-            "_".join(
-                link_pattern.search(link)
-                .group(1)
-                .lower()
-                .replace("-", "_")
-                .split("_")[0:-2]
-            )
-            for link in links
+            "_".join(match.group(1).lower().replace("-", "_").split("_")[0:-2])
+            for match in links.values()
         ]
 
         # Raise error if any expected form missing.
@@ -57,8 +51,8 @@ class PhmsaGasArchiver(AbstractDatasetArchiver):
                 f"Expected form download links not found for forms: {missing_data}"
             )
 
-        for link in await self.get_hyperlinks(BASE_URL, link_pattern):
-            yield self.get_zip_resource(link, link_pattern.search(link))
+        for link, match in links.items():
+            yield self.get_zip_resource(link, match)
 
     async def get_zip_resource(
         self, link: str, match: typing.Match
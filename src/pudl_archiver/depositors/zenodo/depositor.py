@@ -143,14 +143,13 @@ class ZenodoAPIClient(DepositorAPIClient):
         file_bytes = None
         if file_info := deposition.files_map.get(filename):
             url = file_info.links.canonical
-            response = await self._request(
+            file_bytes = await self._request(
                 "GET",
                 url,
                 f"Download {filename}",
-                parse_json=False,
+                read_bytes=True,
                 headers=self.auth_write,
             )
-            file_bytes = await retry_async(response.read)
         return file_bytes
 
     async def list_files(self, deposition: Deposition) -> list[str]:
@@ -499,9 +498,10 @@ class ZenodoAPIClient(DepositorAPIClient):
             url: str,
             log_label: str,
             parse_json: bool = True,
+            read_bytes: bool = False,
             retry_count: int = 7,
             **kwargs,
-        ) -> dict | aiohttp.ClientResponse:
+        ) -> dict | bytes | aiohttp.ClientResponse:
             """Make requests to Zenodo.
 
             Args:
@@ -511,9 +511,14 @@ class ZenodoAPIClient(DepositorAPIClient):
                     logging purposes.
                 parse_json: whether or not to always parse the response as a
                     JSON object. Default to True.
+                read_bytes: whether to return the raw response body instead.
+                    The body is read within each retried request, since a
+                    response can only be read once. Takes precedence over
+                    parse_json. Default to False.
 
             Returns:
-                Either the parsed JSON or the raw aiohttp.ClientResponse object.
+                Either the parsed JSON, the response body, or the raw
+                aiohttp.ClientResponse object.
             """
             logger.info(f"{method} {url} - {log_label}")
 
@@ -533,6 +538,8 @@ class ZenodoAPIClient(DepositorAPIClient):
                         status=response.status,
                         message=message,
                     )
+                if read_bytes:
+                    return await response.read()
                 if parse_json:
                     return await response.json()
                 return response
@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import random
 import typing
 import zipfile
 from collections.abc import Awaitable, Callable
@@ -20,6 +21,29 @@ logger = logging.getLogger(f"catalystcoop.{__name__}")
 Url = typing.Annotated[AnyUrl, PlainSerializer(lambda url: str(url), return_type=str)]
 
 
+def backoff_delay_s(
+    try_count: int,
+    base_s: float,
+    jitter: float = 0.5,
+    max_s: float | None = None,
+) -> float:
+    """Compute how long to wait before the next try, with exponential backoff.
+
+    Adding random jitter to the delay keeps many concurrent downloads that
+    failed at the same time from all retrying at the same time.
+
+    Args:
+        try_count: the (1-indexed) try that just failed.
+        base_s: how many seconds to wait after the first try.
+        jitter: maximum fraction of the delay to randomly add to it.
+        max_s: if present, never wait longer than this many seconds.
+    """
+    delay_s = base_s * 2 ** (try_count - 1) * (1 + random.random() * jitter)  # noqa: S311
+    if max_s is not None:
+        delay_s = min(delay_s, max_s)
+    return delay_s
+
+
 async def retry_async(
     async_func: Callable[..., Awaitable[typing.Any]],
     args: list | None = None,
@@ -28,7 +52,7 @@ async def retry_async(
     retry_base_s: int = 2,
     retry_on: tuple[type[Exception], ...] = (aiohttp.ClientError, asyncio.TimeoutError),
 ):
-    """Retry a function that returns a coroutine, with exponential backoff.
+    """Retry a function that returns a coroutine, with jittered exponential backoff.
 
     Args:
         async_func: the function to retry.
@@ -53,21 +77,62 @@ async def retry_async(
         except retry_on as e:
             if try_count == retry_count:
                 raise e
-            retry_delay_s = retry_base_s * 2 ** (try_count - 1)
+            retry_delay_s = backoff_delay_s(try_count, retry_base_s)
             logger.info(
-                f"Error while executing {coro} (try #{try_count}, retry in {retry_delay_s}s): {type(e)} - {e}"
+                f"Error while executing {coro} (try #{try_count}, retry in {retry_delay_s:.1f}s): {type(e)} - {e}"
             )
             await asyncio.sleep(retry_delay_s)
 
 
-def add_to_archive_stable_hash(archive: zipfile.ZipFile, filename, data: bytes):
-    """Add a file to a ZIP archive in a way that makes the hash deterministic.
+async def get_bytes(session: aiohttp.ClientSession, url: str, **kwargs) -> bytes:
+    """Make a GET request and read the whole response body.
+
+    Retry this coroutine as a whole with :func:`retry_async`, rather than retrying
+    ``response.read`` on its own. A response body can only be read once, so
+    retrying the read can't recover from a connection dropped partway through.
+
+    Args:
+        session: HTTP session to make the request with.
+        url: URL to get.
+        kwargs: Key word args to pass to ``session.get``.
+    """
+    async with session.get(url, **kwargs) as response:
+        return await response.read()
+
+
+async def get_text(session: aiohttp.ClientSession, url: str, **kwargs) -> str:
+    """Make a GET request and read the whole response body as text.
+
+    See :func:`get_bytes` for how to retry it.
+    """
+    async with session.get(url, **kwargs) as response:
+        return await response.text()
+
+
+PRECOMPRESSED_EXTENSIONS: frozenset[str] = frozenset(
+    {"gz", "jpg", "parquet", "pdf", "png", "xlsx", "zip"}
+)
+"""File types that are already compressed, so DEFLATE-ing them again is wasted CPU."""
+
+
+def zip_compression_for(filename: str) -> int:
+    """Pick the ZIP compression method to archive a file with, based on its extension."""
+    if Path(filename).suffix.lower().lstrip(".") in PRECOMPRESSED_EXTENSIONS:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def zipinfo_stable_hash(filename: str) -> zipfile.ZipInfo:
+    """Describe a file in a ZIP archive in a way that makes the hash deterministic.
 
     ZIP files include some datetime metadata that changes based on when you add
     the file to the archive. This makes their hashes inherently unstable.
 
     We set the datetime to the earliest possible ZIP datetime, 1980-01-01 (not
     1970! just a quirk of ZIP) to make the hashes stable.
+
+    Files that are already compressed (see :data:`PRECOMPRESSED_EXTENSIONS`) are
+    stored as-is, everything else is DEFLATE-compressed.
     """
     info = zipfile.ZipInfo(
         filename=filename,
@@ -76,8 +141,16 @@ def add_to_archive_stable_hash(archive: zipfile.ZipFile, filename, data: bytes):
     )
     # default is ZIP_STORED, which means "uncompressed"
     # also this can't be set in the constructor as of 2024-02-09
-    info.compress_type = zipfile.ZIP_DEFLATED
-    archive.writestr(info, data)
+    info.compress_type = zip_compression_for(filename)
+    return info
+
+
+def add_to_archive_stable_hash(archive: zipfile.ZipFile, filename, data: bytes):
+    """Add a file to a ZIP archive in a way that makes the hash deterministic.
+
+    See :func:`zipinfo_stable_hash` for details.
+    """
+    archive.writestr(zipinfo_stable_hash(filename), data)
 
 
 async def _rate_limited_scheduler(
@@ -1,5 +1,7 @@
 """Pytest configuration module."""
 
+import asyncio
+import sys
 from datetime import datetime
 
 import pytest
@@ -7,6 +9,19 @@ import pytest
 from pudl_archiver.frictionless import DataPackage
 
 
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests on uvloop where it's available."""
+    if sys.platform != "win32":
+        try:
+            import uvloop
+
+            return uvloop.EventLoopPolicy()
+        except ImportError:
+            pass
+    return asyncio.DefaultEventLoopPolicy()
+
+
 @pytest.fixture()
 def datapackage():
     """Create test datapackage descriptor."""
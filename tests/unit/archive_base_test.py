@@ -1,45 +1,77 @@
 """Test archiver abstract base class."""
 
-import copy
+import asyncio
 import io
 import logging
+import os
 import re
+import shutil
 import tempfile
 import zipfile
+from contextlib import asynccontextmanager
 from pathlib import Path
+from unittest.mock import patch
 
+import aiohttp
 import pytest
 import requests
 from aiohttp import ClientSession
+from pydantic import AnyUrl
 
 from pudl_archiver.archivers.classes import AbstractDatasetArchiver, ArchiveAwaitable
 from pudl_archiver.archivers.validate import ValidationTestResult, validate_filetype
 from pudl_archiver.frictionless import Resource, ResourceInfo
+from pudl_archiver.utils import add_to_archive_stable_hash
+
+_ZIP_PATTERN = re.compile(r"test_\d{4}\.zip")
+
+
+@pytest.fixture()
+def tmpdir_mem():
+    """Create a temporary directory in memory (/dev/shm) where available."""
+    shm = Path("/dev/shm")  # noqa: S108
+    in_memory = shm.is_dir() and os.access(shm, os.W_OK)
+    path = Path(tempfile.mkdtemp(dir=shm if in_memory else None))
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
 
 
 @pytest.fixture()
-def bad_zipfile():
+def bad_zipfile(tmpdir_mem):
     """Create a fake bad zipfile as a temp file."""
-    with tempfile.TemporaryDirectory() as path:
-        zip_path = Path(path) / "test.zip"
-        with Path.open(zip_path, "wb") as archive:
-            archive.write(b"Fake non-zipfile data")
+    zip_path = tmpdir_mem / "bad.zip"
+    with Path.open(zip_path, "wb") as archive:
+        archive.write(b"Fake non-zipfile data")
 
-        yield zip_path
+    return zip_path
 
 
 @pytest.fixture()
-def good_zipfile():
+def good_zipfile(tmpdir_mem):
     """Create a fake good zipfile in temporary directory."""
-    with tempfile.TemporaryDirectory() as path:
-        zip_path = Path(path) / "test.zip"
-        with (
-            zipfile.ZipFile(zip_path, "w") as archive,
-            archive.open("test.txt", "w") as file,
-        ):
-            file.write(b"Test good zipfile")
+    zip_path = tmpdir_mem / "good.zip"
+    with (
+        zipfile.ZipFile(zip_path, "w") as archive,
+        archive.open("test.txt", "w") as file,
+    ):
+        file.write(b"Test good zipfile")
+
+    return zip_path
 
-        yield zip_path
+
+@pytest.fixture(scope="module", autouse=True)
+def patch_file_validations():
+    """Mock out the file validations run on every downloaded resource.
+
+    The patches stay in place for every test in this module. Tests of the
+    validations themselves import them directly from the validate module.
+    """
+    with (
+        patch("pudl_archiver.archivers.classes.validate.validate_filetype"),
+        patch("pudl_archiver.archivers.classes.validate.validate_file_not_empty"),
+        patch("pudl_archiver.archivers.classes.validate.validate_zip_layout"),
+    ):
+        yield
 
 
 @pytest.fixture()
@@ -48,31 +80,38 @@ def file_data():
     return b"Junk test file data"
 
 
+# Validated once, then copied with only the fields each test cares about changed
+_PROTO_RESOURCE = Resource(
+    name="resource",
+    path="https://www.example.com/resource",
+    title="",
+    parts={},
+    mediatype="",
+    format="",
+    bytes=10,
+    hash="",
+)
+
+
 def _resource_w_size(name: str, size: int):
     """Create resource with variable size for use in tests."""
-    return Resource(
-        name=name,
-        path=f"https://www.example.com/{name}",
-        title="",
-        parts={},
-        mediatype="",
-        format="",
-        bytes=size,
-        hash="",
+    return _PROTO_RESOURCE.model_copy(
+        update={
+            "name": name,
+            "path": AnyUrl(f"https://www.example.com/{name}"),
+            "bytes_": size,
+        }
     )
 
 
 def _resource_w_parts(name: str, parts: dict):
     """Create resource with variable size for use in tests."""
-    return Resource(
-        name=name,
-        path=f"https://www.example.com/{name}",
-        title="",
-        parts=parts,
-        mediatype="",
-        format="",
-        bytes=10,
-        hash="",
+    return _PROTO_RESOURCE.model_copy(
+        update={
+            "name": name,
+            "path": AnyUrl(f"https://www.example.com/{name}"),
+            "parts": parts,
+        }
     )
 
 
@@ -97,24 +136,107 @@ class MockArchiver(AbstractDatasetArchiver):
         return self.test_results
 
 
-@pytest.fixture()
-def html_docs():
-    """Define html docs for parser test."""
-    return {
-        "simple": """<!doctype html>
-        <html>
-            <body>
-                <h1>random heading</h1>
-                <p>paragraph</p>
-                <a href='https://www.fake.link.com/test_2019.zip'>text</a>
-                <div>
-                    <a href='https://www.fake.link.com/test_2020.zip'>text</a>
-                </div>
-                <a href='https://www.fake.link.com/not/a/match/'>text</a>
-            </body>
-        </html>
-        """,
+@pytest.fixture(scope="module")
+def mock_archiver():
+    """Share one MockArchiver across tests of its stateless validation checks."""
+    return MockArchiver(None)
+
+
+class _StubResponse:
+    """Stand-in for an aiohttp response whose body is a fixed payload."""
+
+    def __init__(self, payload: bytes | str):
+        self.payload = payload
+        self.headers = {}
+        self.content_length = len(payload)
+        # Body is streamed from response.content, like aiohttp's StreamReader
+        self.content = self
+
+    async def read(self):
+        return self.payload
+
+    async def text(self):
+        return self.payload
+
+    async def iter_chunked(self, chunk_size: int):
+        for i in range(0, len(self.payload), chunk_size):
+            yield self.payload[i : i + chunk_size]
+
+
+class _StubSession:
+    """Stand-in for an aiohttp session that answers every GET with one payload."""
+
+    def __init__(self, payload: bytes | str):
+        self.payload = payload
+        self.requested_urls: list[str] = []
+
+    @asynccontextmanager
+    async def get(self, url: str, **kwargs):
+        self.requested_urls.append(url)
+        yield _StubResponse(self.payload)
+
+
+# HTML docs for parser test
+HTML_DOCS = {
+    "simple": """<!doctype html>
+    <html>
+        <body>
+            <h1>random heading</h1>
+            <p>paragraph</p>
+            <a href='https://www.fake.link.com/test_2019.zip'>text</a>
+            <div>
+                <a href='https://www.fake.link.com/test_2020.zip'>text</a>
+            </div>
+            <a href='https://www.fake.link.com/not/a/match/'>text</a>
+        </body>
+    </html>
+    """,
+    "attribute_styles": """<!doctype html>
+    <html>
+        <head>
+            <link href="https://www.fake.link.com/style.css" rel="stylesheet">
+        </head>
+        <body>
+            <A class="download" HREF="https://www.fake.link.com/test_2019.zip">text</A>
+            <a data-href="https://www.fake.link.com/test_2018.zip">text</a>
+            <a href=https://www.fake.link.com/test_2020.zip>text</a>
+            <a href="https://www.fake.link.com/page?year=2021&amp;view=data">text</a>
+        </body>
+    </html>
+    """,
+    "not_links": """<!doctype html>
+    <html>
+        <head>
+            <script>
+                var old = '<a href="https://www.fake.link.com/test_2017.zip">';
+            </script>
+        </head>
+        <body>
+            <!-- <a href="https://www.fake.link.com/test_2018.zip">text</a> -->
+            <a title="a>b" href="https://www.fake.link.com/test_2019.zip">text</a>
+            <a title='see href=fake.zip' href="https://www.fake.link.com/test_2020.zip">
+                text
+            </a>
+        </body>
+    </html>
+    """,
+}
+
+# Links expected to be found in HTML_DOCS
+_SIMPLE_ZIP_LINKS = frozenset(
+    {
+        "https://www.fake.link.com/test_2019.zip",
+        "https://www.fake.link.com/test_2020.zip",
+    }
+)
+_SIMPLE_LINKS = _SIMPLE_ZIP_LINKS | {"https://www.fake.link.com/not/a/match/"}
+_ATTRIBUTE_STYLES_LINKS = frozenset(
+    {
+        "https://www.fake.link.com/test_2019.zip",
+        "https://www.fake.link.com/test_2020.zip",
+        "https://www.fake.link.com/page?year=2021&view=data",
     }
+)
 
 
 @pytest.mark.asyncio
@@ -149,22 +271,104 @@ async def test_resource_chunks(
                 local_path=Path(self.download_directory), partitions={"idx": i}
             )
 
-    tmpdir_mock = mocker.Mock(side_effect=[Path(f"path{i}") for i in range(6)])
+    tmpdirs = [mocker.Mock() for _ in range(6)]
+    for i, tmpdir in enumerate(tmpdirs):
+        tmpdir.name = f"path{i}"
+    tmpdir_mock = mocker.Mock(side_effect=tmpdirs)
     mocker.patch(
         "pudl_archiver.archivers.classes.tempfile.TemporaryDirectory",
         new=tmpdir_mock,
     )
 
-    # Mock out file validations
-    mocker.patch("pudl_archiver.archivers.classes.validate.validate_filetype")
-    mocker.patch("pudl_archiver.archivers.classes.validate.validate_file_not_empty")
-    mocker.patch("pudl_archiver.archivers.classes.validate.validate_zip_layout")
-
     # Initialize MockArchiver class
     archiver = MockArchiver(concurrency_limit, directory_per_resource_chunk)
     async for name, resource in archiver.download_all_resources():
         assert download_paths[resource.partitions["idx"]] == name
 
+    # Only the last two chunk directories should be left around
+    if directory_per_resource_chunk:
+        chunk_tmpdirs = tmpdirs[1 : tmpdir_mock.call_count]
+        for tmpdir in chunk_tmpdirs[:-2]:
+            tmpdir.cleanup.assert_called_once()
+        for tmpdir in chunk_tmpdirs[-2:]:
+            tmpdir.cleanup.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit():
+    """Never run more than concurrency_limit downloads, but keep that many running."""
+    running = 0
+    max_running = 0
+
+    class MockArchiver(AbstractDatasetArchiver):
+        name = "mock"
+        concurrency_limit = 2
+
+        async def get_resources(self):
+            # One slow download shouldn't hold up the rest
+            yield self.get_resource(0, 0.05)
+            for i in range(1, 5):
+                yield self.get_resource(i, 0.001)
+
+        async def get_resource(self, i, delay):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(running, max_running)
+            await asyncio.sleep(delay)
+            running -= 1
+            return ResourceInfo(local_path=Path(f"path{i}"), partitions={"idx": i})
+
+    archiver = MockArchiver(None)
+    names = [name async for name, _ in archiver.download_all_resources()]
+    assert max_running == 2
+    assert names[-1] == "path0"
+
+
+@pytest.mark.asyncio
+async def test_download_while_finding_resources():
+    """Start downloading resources before get_resources has found all of them."""
+    downloaded = asyncio.Event()
+
+    class MockArchiver(AbstractDatasetArchiver):
+        name = "mock"
+
+        async def get_resources(self):
+            yield self.get_resource(0)
+            # Would time out if downloads only started once all resources are found
+            await asyncio.wait_for(downloaded.wait(), timeout=1)
+            yield self.get_resource(1)
+
+        async def get_resource(self, i):
+            downloaded.set()
+            return ResourceInfo(local_path=Path(f"path{i}"), partitions={"idx": i})
+
+    archiver = MockArchiver(None)
+    names = [name async for name, _ in archiver.download_all_resources()]
+    assert names == ["path0", "path1"]
+
+
+@pytest.mark.asyncio
+async def test_download_all_resources_error():
+    """Errors while downloading a resource should be raised to the caller."""
+
+    class MockArchiver(AbstractDatasetArchiver):
+        name = "mock"
+        concurrency_limit = 2
+
+        async def get_resources(self):
+            for i in range(5):
+                yield self.get_resource(i)
+
+        async def get_resource(self, i):
+            if i == 3:
+                raise RuntimeError("Download failed")
+            return ResourceInfo(local_path=Path(f"path{i}"), partitions={"idx": i})
+
+    archiver = MockArchiver(None)
+    with pytest.raises(RuntimeError, match="Download failed"):
+        async for _ in archiver.download_all_resources():
+            pass
+
 
 @pytest.mark.asyncio
 async def test_download_zipfile(mocker, bad_zipfile, good_zipfile):
@@ -176,6 +380,7 @@ async def test_download_zipfile(mocker, bad_zipfile, good_zipfile):
     mocked_download_file = mocker.patch(
         "pudl_archiver.archivers.classes.AbstractDatasetArchiver.download_file"
     )
+    sleep_mock = mocker.patch("pudl_archiver.archivers.classes.asyncio.sleep")
 
     # Initialize MockArchiver class
     archiver = MockArchiver(None)
@@ -187,6 +392,8 @@ async def test_download_zipfile(mocker, bad_zipfile, good_zipfile):
         await archiver.download_zipfile(url, bad_zipfile, retries=4)
         # though - if we retry 4 times, technically shouldn't we have called 5?
     assert mocked_download_file.call_count == 4
+    # Back off between attempts, but not after the final one
+    assert sleep_mock.call_count == 3
 
     # Test function succeeds with path to zipfile
     assert not await archiver.download_zipfile(url, good_zipfile)
@@ -198,7 +405,7 @@ async def test_download_zipfile(mocker, bad_zipfile, good_zipfile):
 
 
 @pytest.mark.asyncio
-async def test_download_file(mocker, tmp_path):
+async def test_download_file(mocker, tmpdir_mem):
     """Test download_file.
 
     Tests that expected data is written to file on disk or in memory. We use Catalyst's
@@ -223,87 +430,114 @@ async def test_download_file(mocker, tmp_path):
         assert file.getvalue() == file_content
 
         # Rerun with path to file
-        file_path = tmp_path / "test"
+        file_path = tmpdir_mem / "test"
         await archiver.download_file(url, file_path)
         assert file_path.read_bytes() == file_content
 
 
 @pytest.mark.asyncio
-async def test_download_and_zip_file(mocker, file_data):
+@pytest.mark.parametrize("archive_type", ["bytesio", "path"])
+async def test_download_and_zip_file(file_data, tmpdir_mem, archive_type):
     """Test download_and_zip_file.
 
-    Tests that expected data is written to file on disk in a zipfile.
+    Tests that expected data is written to a zipfile in memory or on disk.
     """
     # Initialize MockArchiver class
     archiver = MockArchiver(None)
 
-    session_mock = mocker.AsyncMock(name="session_mock")
-    archiver.session = session_mock
-
-    # Set return value
-    response_mock = mocker.AsyncMock()
-    response_mock.read = mocker.AsyncMock(return_value=file_data)
-    session_mock.get = mocker.AsyncMock(return_value=response_mock)
+    archiver.session = _StubSession(file_data)
 
     # Prepare args
     url = "https://www.fake.url.com"
 
-    # Run test with path to temp dir
-    with tempfile.TemporaryDirectory() as path:
-        file_path = str(Path(path) / "test.csv")
-        archive_path = str(Path(path) / "test.zip")
+    file_path = "test.csv"
+    archive_path = (
+        io.BytesIO() if archive_type == "bytesio" else tmpdir_mem / "test.zip"
+    )
 
-        await archiver.download_and_zip_file(url, file_path, archive_path)
-        # Assert that the zipfile at archive_path contains a file at file_path
-        session_mock.get.assert_called_once_with(url)
-        with zipfile.ZipFile(archive_path) as zf:
-            zipped_file = zf.open(file_path)
-            assert zipped_file.read() == file_data
+    await archiver.download_and_zip_file(url, file_path, archive_path)
+    # Assert that the zipfile at archive_path contains a file at file_path
+    assert archiver.session.requested_urls == [url]
+    with zipfile.ZipFile(archive_path) as zf:
+        zipped_file = zf.open(file_path)
+        assert zipped_file.read() == file_data
+
+
+@pytest.mark.asyncio
+async def test_download_and_zip_file_retry(mocker, file_data):
+    """A retried download_and_zip_file shouldn't keep bytes from the failed try."""
+
+    class _FlakyResponse(_StubResponse):
+        async def iter_chunked(self, chunk_size: int):
+            yield self.payload
+            raise aiohttp.ClientPayloadError("Connection dropped")
+
+    class _FlakySession(_StubSession):
+        @asynccontextmanager
+        async def get(self, url: str, **kwargs):
+            self.requested_urls.append(url)
+            if len(self.requested_urls) == 1:
+                yield _FlakyResponse(self.payload)
+            else:
+                yield _StubResponse(self.payload)
+
+    mocker.patch("pudl_archiver.utils.asyncio.sleep")
+    archiver = MockArchiver(None)
+    archiver.session = _FlakySession(file_data)
+
+    archive = io.BytesIO()
+    await archiver.download_and_zip_file(
+        "https://www.fake.url.com", "test.csv", archive
+    )
+    assert len(archiver.session.requested_urls) == 2
+    with zipfile.ZipFile(archive) as zf:
+        # Archive starts right at the beginning of the buffer
+        assert zf.infolist()[0].header_offset == 0
+        assert zf.read("test.csv") == file_data
+
+
+def test_add_to_archive(tmpdir_mem):
+    """add_to_archive should write the same archive as add_to_archive_stable_hash."""
+    archiver = MockArchiver(None)
+    file_path = tmpdir_mem / "test.csv"
+    file_path.write_bytes(b"Call me Ishmael. " * 10_000)
+
+    streamed, in_memory = io.BytesIO(), io.BytesIO()
+    with (
+        zipfile.ZipFile(streamed, "w") as archive,
+        file_path.open("rb") as blob,
+    ):
+        archiver.add_to_archive(archive=archive, filename="test.csv", blob=blob)
+    with zipfile.ZipFile(in_memory, "w") as archive:
+        add_to_archive_stable_hash(archive, "test.csv", file_path.read_bytes())
+
+    assert streamed.getvalue() == in_memory.getvalue()
 
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "docname,pattern,links",
     [
-        (
-            "simple",
-            re.compile(r"test_\d{4}.zip"),
-            [
-                "https://www.fake.link.com/test_2019.zip",
-                "https://www.fake.link.com/test_2020.zip",
-            ],
-        ),
-        (
-            "simple",
-            None,
-            [
-                "https://www.fake.link.com/test_2019.zip",
-                "https://www.fake.link.com/test_2020.zip",
-                "https://www.fake.link.com/not/a/match/",
-            ],
-        ),
+        ("simple", _ZIP_PATTERN, _SIMPLE_ZIP_LINKS),
+        ("simple", None, _SIMPLE_LINKS),
+        ("attribute_styles", None, _ATTRIBUTE_STYLES_LINKS),
+        ("not_links", None, _SIMPLE_ZIP_LINKS),
     ],
 )
-async def test_get_hyperlinks(docname, pattern, links, request, html_docs):
+async def test_get_hyperlinks(docname, pattern, links):
     """Test get hyperlinks function."""
     # Get desired html doc
-    html = html_docs[docname]
+    html = HTML_DOCS[docname]
 
     # Initialize MockArchiver class
     archiver = MockArchiver(None)
+    archiver.session = _StubSession(html)
 
-    mocker = request.getfixturevalue("mocker")
+    assert await archiver.get_hyperlinks("fake_url", pattern) == links
 
-    session_mock = mocker.AsyncMock(name="session_mock", spec=ClientSession)
-    archiver.session = session_mock
-
-    # Set return value
-    response_mock = mocker.AsyncMock()
-    response_mock.text = mocker.AsyncMock(return_value=html)
-    session_mock.get = mocker.AsyncMock(return_value=response_mock)
-
-    found_links = await archiver.get_hyperlinks("fake_url", pattern)
-    assert set(found_links) == set(links)
+    # Page should only be fetched once
+    assert await archiver.get_hyperlinks("fake_url", pattern) == links
+    assert archiver.session.requested_urls == ["fake_url"]
 
 
 @pytest.mark.parametrize(
@@ -328,18 +562,19 @@ async def test_get_hyperlinks(docname, pattern, links, request, html_docs):
     ],
     ids=["create_file", "delete_file"],
 )
-def test_check_missing_files(datapackage, baseline_resources, new_resources, success):
+def test_check_missing_files(
+    mock_archiver, datapackage, baseline_resources, new_resources, success
+):
     """Test the ``_check_missing_files`` validation test."""
-    archiver = MockArchiver(None)
-
-    baseline_datapackage = copy.deepcopy(datapackage)
-    baseline_datapackage.resources = baseline_resources
+    baseline_datapackage = datapackage.model_copy(
+        update={"resources": baseline_resources}
+    )
 
-    new_datapackage = copy.deepcopy(datapackage)
-    new_datapackage.resources = new_resources
+    new_datapackage = datapackage.model_copy(update={"resources": new_resources})
 
-    validation_result = archiver._check_missing_files(
-        baseline_datapackage, new_datapackage
+    validation_result = mock_archiver._check_missing_files(
+        mock_archiver._summarize(baseline_datapackage),
+        mock_archiver._summarize(new_datapackage),
     )
     assert validation_result.success == success
 
@@ -406,20 +641,23 @@ def test_check_missing_files(datapackage, baseline_resources, new_resources, suc
         "no_base_datapackage",
     ],
 )
-def test_check_file_size(datapackage, baseline_resources, new_resources, success):
+def test_check_file_size(
+    mock_archiver, datapackage, baseline_resources, new_resources, success
+):
     """Test the ``_check_file_size`` validation test."""
-    archiver = MockArchiver(None)
-
     if baseline_resources is None:
         baseline_datapackage = None
     else:
-        baseline_datapackage = copy.deepcopy(datapackage)
-        baseline_datapackage.resources = baseline_resources
+        baseline_datapackage = datapackage.model_copy(
+            update={"resources": baseline_resources}
+        )
 
-    new_datapackage = copy.deepcopy(datapackage)
-    new_datapackage.resources = new_resources
+    new_datapackage = datapackage.model_copy(update={"resources": new_resources})
 
-    validation_result = archiver._check_file_size(baseline_datapackage, new_datapackage)
+    validation_result = mock_archiver._check_file_size(
+        mock_archiver._summarize(baseline_datapackage),
+        mock_archiver._summarize(new_datapackage),
+    )
     assert validation_result.success == success
 
 
@@ -440,20 +678,19 @@ def test_check_file_size(datapackage, baseline_resources, new_resources, success
     ],
 )
 def test_check_zero_file_size(
-    datapackage, baseline_resources, new_resources, success, caplog
+    mock_archiver, datapackage, baseline_resources, new_resources, success, caplog
 ):
     """Test the ``_check_file_size`` validation test."""
-    archiver = MockArchiver(None)
-
-    baseline_datapackage = copy.deepcopy(datapackage)
-    baseline_datapackage.resources = baseline_resources
+    baseline_datapackage = datapackage.model_copy(
+        update={"resources": baseline_resources}
+    )
 
-    new_datapackage = copy.deepcopy(datapackage)
-    new_datapackage.resources = new_resources
+    new_datapackage = datapackage.model_copy(update={"resources": new_resources})
 
     with caplog.at_level(logging.WARN):
-        validation_result = archiver._check_file_size(
-            baseline_datapackage, new_datapackage
+        validation_result = mock_archiver._check_file_size(
+            mock_archiver._summarize(baseline_datapackage),
+            mock_archiver._summarize(new_datapackage),
         )
     assert validation_result.success == success
     assert "Original file size was zero" in caplog.text
@@ -520,21 +757,22 @@ def test_check_zero_file_size(
         "no_base_datapackage",
     ],
 )
-def test_check_dataset_size(datapackage, baseline_resources, new_resources, success):
+def test_check_dataset_size(
+    mock_archiver, datapackage, baseline_resources, new_resources, success
+):
     """Test the ``_check_dataset_size`` validation test."""
-    archiver = MockArchiver(None)
-
     if baseline_resources is None:
         baseline_datapackage = None
     else:
-        baseline_datapackage = copy.deepcopy(datapackage)
-        baseline_datapackage.resources = baseline_resources
+        baseline_datapackage = datapackage.model_copy(
+            update={"resources": baseline_resources}
+        )
 
-    new_datapackage = copy.deepcopy(datapackage)
-    new_datapackage.resources = new_resources
+    new_datapackage = datapackage.model_copy(update={"resources": new_resources})
 
-    validation_result = archiver._check_dataset_size(
-        baseline_datapackage, new_datapackage
+    validation_result = mock_archiver._check_dataset_size(
+        mock_archiver._summarize(baseline_datapackage),
+        mock_archiver._summarize(new_datapackage),
     )
     assert validation_result.success == success
 
@@ -550,118 +788,94 @@ def test_year_filter():
     assert archiver_no_filter.valid_year(2021)
 
 
+@pytest.fixture()
+def new_datapackage(request, datapackage):
+    """Build a datapackage with one resource per partitions dict in request.param."""
+    new_resources = [
+        _resource_w_parts(f"resource{i}", parts)
+        for i, parts in enumerate(request.param)
+    ]
+    return datapackage.model_copy(update={"resources": new_resources})
+
+
 @pytest.mark.parametrize(
-    "new_resources,success,notes",
+    "new_datapackage,success,notes",
     [
         (
             [
-                _resource_w_parts(
-                    "resource0",
-                    {"year_quarter": ["1995q1", "1995q2", "1995q3", "1995q4"]},
-                ),
-                _resource_w_parts(
-                    "resource1", {"year_quarter": ["1996q1", "1996q2", "1996q3"]}
-                ),
+                {"year_quarter": ["1995q1", "1995q2", "1995q3", "1995q4"]},
+                {"year_quarter": ["1996q1", "1996q2", "1996q3"]},
             ],
             True,
             "All tested partitions",
         ),
         (
             [
-                _resource_w_parts(
-                    "resource0",
-                    {"year_month": [f"1995-{month:02d}" for month in range(2, 13)]},
-                ),
-                _resource_w_parts(
-                    "resource1",
-                    {"year_month": [f"1996-{month:02d}" for month in range(1, 8)]},
-                ),
+                {"year_month": [f"1995-{month:02d}" for month in range(2, 13)]},
+                {"year_month": [f"1996-{month:02d}" for month in range(1, 8)]},
             ],
             True,
             "All tested partitions",
         ),
         (
             [
-                _resource_w_parts(
-                    "resource0", {"year_quarter": ["1995q1", "1995q3", "1995q4"]}
-                ),
-                _resource_w_parts(
-                    "resource1", {"year_quarter": ["1996q1", "1996q2", "1996q3"]}
-                ),
+                {"year_quarter": ["1995q1", "1995q3", "1995q4"]},
+                {"year_quarter": ["1996q1", "1996q2", "1996q3"]},
             ],
             False,
             "not continuous",
         ),
         (
             [
-                _resource_w_parts(
-                    "resource0",
-                    {
-                        "year_quarter": [
-                            "1995q1",
-                            "1995q1",
-                            "1995q2",
-                            "1995q3",
-                            "1995q4",
-                        ]
-                    },
-                )
+                {
+                    "year_quarter": [
+                        "1995q1",
+                        "1995q1",
+                        "1995q2",
+                        "1995q3",
+                        "1995q4",
+                    ]
+                }
             ],
             False,
             "duplicate time periods",
         ),
         (
             [
-                _resource_w_parts("resource0", {"year_quarter": "1995q1"}),
-                _resource_w_parts("resource1", {"year_quarter": "1995q2"}),
+                {"year_quarter": "1995q1"},
+                {"year_quarter": "1995q2"},
             ],
             True,
             "All tested partitions",
         ),
         (
             [
-                _resource_w_parts("resource0", {"year": "1995"}),
-                _resource_w_parts("resource1", {"year": "1996"}),
+                {"year": "1995"},
+                {"year": "1996"},
             ],
             True,
             "not configured for this test",
         ),
         (
             [
-                _resource_w_parts(
-                    "resource1", {"year_quarter": ["1996q1", "1996q2", "1996q3"]}
-                ),
-                _resource_w_parts(
-                    "resource0",
-                    {"year_quarter": ["1995q1", "1995q2", "1995q3", "1995q4"]},
-                ),
+                {"year_quarter": ["1996q1", "1996q2", "1996q3"]},
+                {"year_quarter": ["1995q1", "1995q2", "1995q3", "1995q4"]},
             ],
             True,
             "All tested partitions",
         ),
         (
             [
-                _resource_w_parts(
-                    "resource0", {"year_quarter": ["1995q1", "1995q2"], "form": "junk"}
-                ),
-                _resource_w_parts(
-                    "resource1",
-                    {"year_quarter": ["1995q3", "1995q4"], "form": "random"},
-                ),
+                {"year_quarter": ["1995q1", "1995q2"], "form": "junk"},
+                {"year_quarter": ["1995q3", "1995q4"], "form": "random"},
             ],
             True,
             "All tested partitions",
         ),
         (
             [
-                _resource_w_parts(
-                    "resource0",
-                    {"year_quarter": ["1995q1", "1995q2"], "year_month": "1995-01"},
-                ),
-                _resource_w_parts(
-                    "resource1",
-                    {"year_quarter": ["1995q3", "1995q4"], "year_month": "1995-06"},
-                ),
+                {"year_quarter": ["1995q1", "1995q2"], "year_month": "1995-01"},
+                {"year_quarter": ["1995q3", "1995q4"], "year_month": "1995-06"},
             ],
             False,
             "more than one partition",
@@ -678,12 +892,11 @@ def test_year_filter():
         "multiple_partitions",
         "multiple_tested_partitions",
     ],
+    indirect=["new_datapackage"],
 )
-def test_check_data_continuity(datapackage, new_resources, success, notes):
+def test_check_data_continuity(new_datapackage, success, notes):
     """Test the dataset archiving valiation for epacems."""
     archiver = MockArchiver(None)
-    new_datapackage = copy.deepcopy(datapackage)
-    new_datapackage.resources = new_resources
     validation = archiver._check_data_continuity(new_datapackage)
     assert validation.success == success
     assert notes in validation.notes[0]  # Check exact success/fail reason
@@ -5,20 +5,54 @@ from pudl_archiver.archivers.eia.eia860m import Eia860MArchiver
 from pudl_archiver.archivers.eia.eia861 import Eia861Archiver
 from pudl_archiver.archivers.eia.eia923 import Eia923Archiver
 
+_EIA860_URLS = tuple(
+    f"https://www.eia.gov/electricity/data/eia860/xls/eia860{y}.zip"
+    for y in range(2000, 2023)
+)
+_EIA861_URLS = tuple(
+    f"https://www.eia.gov/electricity/data/eia861/zip/f861{y}.zip"
+    for y in [95, 96, 11, 12, 2019, 2022]
+)
+_EIA923_URLS = tuple(
+    f"https://www.eia.gov/electricity/data/eia923/zip/f923_{y}.zip"
+    for y in range(2002, 2023)
+)
+_EIA860M_URLS = tuple(
+    f"https://www.eia.gov/electricity/data/eia860m/xls/{m}_generator{y}.xlsx"
+    for y in range(2000, 2023)
+    for m in [
+        "january",
+        "february",
+        "march",
+        "april",
+        "may",
+        "june",
+        "july",
+        "august",
+        "september",
+        "october",
+        "november",
+        "december",
+    ]
+)
+
 
 @pytest.mark.asyncio
-async def test_eia860(mocker):
+@pytest.mark.parametrize(
+    "archiver_cls,urls",
+    [
+        (Eia860Archiver, _EIA860_URLS),
+        (Eia861Archiver, _EIA861_URLS),
+        (Eia923Archiver, _EIA923_URLS),
+    ],
+    ids=["eia860", "eia861", "eia923"],
+)
+async def test_eia_annual(mocker, archiver_cls, urls):
     mock_session = mocker.AsyncMock()
-    urls = [
-        f"https://www.eia.gov/electricity/data/eia860/xls/eia860{y}.zip"
-        for y in range(2000, 2023)
-    ]
-    get_hyperlinks = mocker.AsyncMock(return_value=urls)
-    mocker.patch(
-        "pudl_archiver.archivers.eia.eia860.Eia860Archiver.get_hyperlinks",
-        get_hyperlinks,
+    mocker.patch.object(
+        archiver_cls, "_get_page_hyperlinks", mocker.AsyncMock(return_value=set(urls))
     )
-    archiver = Eia860Archiver(mock_session, only_years=[2019, 2022])
+    archiver = archiver_cls(mock_session, only_years=[2019, 2022])
     resources = [res async for res in archiver.get_resources()]
     assert len(resources) == 2
 
@@ -26,28 +60,9 @@ async def test_eia860(mocker):
 @pytest.mark.asyncio
 async def test_eia860m(mocker, tmp_path):
     mock_session = mocker.AsyncMock()
-    urls = [
-        f"https://www.eia.gov/electricity/data/eia860m/xls/{m}_generator{y}.xlsx"
-        for y in range(2000, 2023)
-        for m in [
-            "january",
-            "february",
-            "march",
-            "april",
-            "may",
-            "june",
-            "july",
-            "august",
-            "september",
-            "october",
-            "november",
-            "december",
-        ]
-    ]
-    get_hyperlinks = mocker.AsyncMock(return_value=urls)
     mocker.patch(
-        "pudl_archiver.archivers.eia.eia860m.Eia860MArchiver.get_hyperlinks",
-        get_hyperlinks,
+        "pudl_archiver.archivers.eia.eia860m.Eia860MArchiver._get_page_hyperlinks",
+        mocker.AsyncMock(return_value=set(_EIA860M_URLS)),
     )
 
     def make_fake_file(_url, file, **_kwargs):
@@ -64,37 +79,3 @@ async def test_eia860m(mocker, tmp_path):
     for resource in resources:
         info = await resource
         assert len(info.partitions["year_month"]) == 12
-
-
-@pytest.mark.asyncio
-async def test_eia861(mocker):
-    mock_session = mocker.AsyncMock()
-    urls = [
-        f"https://www.eia.gov/electricity/data/eia861/zip/f861{y}.zip"
-        for y in [95, 96, 11, 12, 2019, 2022]
-    ]
-    get_hyperlinks = mocker.AsyncMock(return_value=urls)
-    mocker.patch(
-        "pudl_archiver.archivers.eia.eia861.Eia861Archiver.get_hyperlinks",
-        get_hyperlinks,
-    )
-    archiver = Eia861Archiver(mock_session, only_years=[2019, 2022])
-    resources = [res async for res in archiver.get_resources()]
-    assert len(resources) == 2
-
-
-@pytest.mark.asyncio
-async def test_eia923(mocker):
-    mock_session = mocker.AsyncMock()
-    urls = [
-        f"https://www.eia.gov/electricity/data/eia923/zip/f923_{y}.zip"
-        for y in range(2002, 2023)
-    ]
-    get_hyperlinks = mocker.AsyncMock(return_value=urls)
-    mocker.patch(
-        "pudl_archiver.archivers.eia.eia923.Eia923Archiver.get_hyperlinks",
-        get_hyperlinks,
-    )
-    archiver = Eia923Archiver(mock_session, only_years=[2019, 2022])
-    resources = [res async for res in archiver.get_resources()]
-    assert len(resources) == 2
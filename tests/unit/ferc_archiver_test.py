@@ -1,6 +1,7 @@
 import json
 import zipfile
 from collections import defaultdict
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 import pytest
@@ -186,19 +187,13 @@ async def test_archive_year_metadata(tmpdir):
         def __init__(self, taxonomy_url: str):
             self.taxonomy_url = taxonomy_url
 
-        @property
-        def content(self):
-            taxonomy_url = self.taxonomy_url
-
-            class Reader:
-                async def read(self):
-                    return taxonomy_url.encode()
-
-            return Reader()
+        async def read(self):
+            return self.taxonomy_url.encode()
 
     class FakeSession:
+        @asynccontextmanager
         async def get(self, url: str, **kwargs):
-            return FakeResponse(taxonomy_url=taxonomy_map[url])
+            yield FakeResponse(taxonomy_url=taxonomy_map[url])
 
     await archive_year(2021, filings, FercForm.FORM_1, Path(tmpdir), FakeSession())
 
@@ -5,7 +5,20 @@ from asyncio import to_thread
 
 import pytest
 
-from pudl_archiver.utils import add_to_archive_stable_hash, retry_async
+from pudl_archiver.utils import (
+    add_to_archive_stable_hash,
+    backoff_delay_s,
+    retry_async,
+    zipinfo_stable_hash,
+)
+
+
+def test_backoff_delay_s():
+    for try_count in range(1, 6):
+        delay_s = backoff_delay_s(try_count, base_s=2, jitter=0.5)
+        assert 2**try_count <= delay_s <= 1.5 * 2**try_count
+
+    assert backoff_delay_s(10, base_s=1, max_s=30) == 30
 
 
 @pytest.mark.asyncio
@@ -33,6 +46,19 @@ async def test_retry_async(mocker):
     assert sleep_mock.call_count == 0
 
 
+@pytest.mark.parametrize(
+    "filename,compress_type",
+    [
+        ("eia860m-2020-01.xlsx", zipfile.ZIP_STORED),
+        ("nested/archive.ZIP", zipfile.ZIP_STORED),
+        ("epacems-2020q1.csv", zipfile.ZIP_DEFLATED),
+        ("no_extension", zipfile.ZIP_DEFLATED),
+    ],
+)
+def test_zipinfo_compression(filename, compress_type):
+    assert zipinfo_stable_hash(filename).compress_type == compress_type
+
+
 def test_stable_zip_hash(tmp_path):
     a_archive = tmp_path / "a.zip"
     b_archive = tmp_path / "b.zip"